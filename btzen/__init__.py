@@ -32,7 +32,7 @@ from .device import DeviceBase, Device, DeviceTrigger, set_interval, \
     set_trigger, set_address_type, create_device, \
     accelerometer, battery_level, button, humidity, light, \
     light_rgb, pressure, serial, temperature, weight
-from .devio import read, read_all, write, enable, disable
+from .devio import read, read_all, read_batch, write, enable, disable
 from .serial import SerialService
 from .service import Service, ServiceCharacteristic, ServiceInterface
 from .cm import connect
@@ -60,7 +60,7 @@ __all__ = [
     'WeightFlags', 'Trigger', 'TriggerCondition',
 
     # bluetooth device i/o
-    'read', 'read_all', 'write',
+    'read', 'read_all', 'read_batch', 'write',
 
     # bluetooth device configuration
     'set_interval', 'set_trigger', 'set_address_type',
@@ -123,7 +123,7 @@ async def bt_read(Bus bus, str path, uint64_t timeout):
     cdef sd_bus_message *msg = NULL
     cdef sd_bus_slot *slot = NULL
 
-    task = asyncio.get_event_loop().create_future()
+    task = asyncio.get_running_loop().create_future()
 
     r = sd_bus_message_new_method_call(
         bus.bus,
@@ -134,18 +134,18 @@ async def bt_read(Bus bus, str path, uint64_t timeout):
         'ReadValue'
     )
     try:
-        _sd_bus.check_call('prepare read data from {}'.format(path), r)
+        _sd_bus.check_call('prepare read data from {}', r, path)
 
         r = sd_bus_message_open_container(msg, 'a', '{sv}')
-        _sd_bus.check_call('bt read open container for {}'.format(path), r)
+        _sd_bus.check_call('bt read open container for {}', r, path)
 
         r = sd_bus_message_close_container(msg)
-        _sd_bus.check_call('bt read close container for {}'.format(path), r)
+        _sd_bus.check_call('bt read close container for {}', r, path)
 
         r = sd_bus_call_async(
             bus.bus, &slot, msg, task_cb_read, <void*>task, timeout
         )
-        _sd_bus.check_call('bt read call async for {}'.format(path), r)
+        _sd_bus.check_call('bt read call async for {}', r, path)
     finally:
         sd_bus_message_unref(msg)
 
@@ -192,7 +192,7 @@ async def bt_write(Bus bus, str path, bytes data, uint64_t timeout):
     cdef sd_bus_slot *slot = NULL
     cdef char* buff = data
 
-    task = asyncio.get_event_loop().create_future()
+    task = asyncio.get_running_loop().create_future()
     r = sd_bus_message_new_method_call(
         bus.bus,
         &msg,
@@ -202,21 +202,21 @@ async def bt_write(Bus bus, str path, bytes data, uint64_t timeout):
         'WriteValue'
     )
     try:
-        _sd_bus.check_call('write data to {}'.format(path), r)
+        _sd_bus.check_call('write data to {}', r, path)
 
         r = sd_bus_message_append_array(msg, 'y', buff, len(data))
-        _sd_bus.check_call('bt write message append for {}'.format(path), r)
+        _sd_bus.check_call('bt write message append for {}', r, path)
 
         r = sd_bus_message_open_container(msg, 'a', '{sv}')
-        _sd_bus.check_call('bt write open container for {}'.format(path), r)
+        _sd_bus.check_call('bt write open container for {}', r, path)
 
         r = sd_bus_message_close_container(msg)
-        _sd_bus.check_call('bt write close container for {}'.format(path), r)
+        _sd_bus.check_call('bt write close container for {}', r, path)
 
         r = sd_bus_call_async(
             bus.bus, &slot, msg, task_cb_write, <void*>task, timeout
         )
-        _sd_bus.check_call('bt write call async for {}'.format(path), r)
+        _sd_bus.check_call('bt write call async for {}', r, path)
     finally:
         sd_bus_message_unref(msg)
 
@@ -228,13 +228,17 @@ async def bt_write(Bus bus, str path, bytes data, uint64_t timeout):
     finally:
         sd_bus_slot_unref(slot)
 
-def bt_write_sync(Bus bus, str path, bytes data):
+def bt_write_sync(Bus bus, str path, bytes data, uint64_t timeout):
     """
     Write data to Bluetooth device.
 
+    The call is synchronous and blocks the event loop for up to the
+    timeout, so use it for small payloads with a short timeout only.
+
     :param bus: D-Bus reference.
     :param path: GATT characteristics path of the device.
     :param data: Data to write.
+    :param timeout: Call timeout in microseconds.
     """
     assert bus is not None
     assert path is not None
@@ -244,27 +248,32 @@ def bt_write_sync(Bus bus, str path, bytes data):
     cdef sd_bus_error error = SD_BUS_ERROR_NULL
     cdef char* buff = data
 
-    r = sd_bus_message_new_method_call(
-        bus.bus,
-        &msg,
-        'org.bluez',
-        path.encode(),
-        'org.bluez.GattCharacteristic1',
-        'WriteValue'
-    )
-    _sd_bus.check_call('write data to {}'.format(path), r)
+    try:
+        r = sd_bus_message_new_method_call(
+            bus.bus,
+            &msg,
+            'org.bluez',
+            path.encode(),
+            'org.bluez.GattCharacteristic1',
+            'WriteValue'
+        )
+        _sd_bus.check_call('write data to {}', r, path)
 
-    r = sd_bus_message_append_array(msg, 'y', buff, len(data))
-    _sd_bus.check_call('write data to {}'.format(path), r)
+        r = sd_bus_message_append_array(msg, 'y', buff, len(data))
+        _sd_bus.check_call('write data to {}', r, path)
 
-    r = sd_bus_message_open_container(msg, 'a', '{sv}')
-    _sd_bus.check_call('write data to {}'.format(path), r)
+        r = sd_bus_message_open_container(msg, 'a', '{sv}')
+        _sd_bus.check_call('write data to {}', r, path)
 
-    r = sd_bus_message_close_container(msg)
-    _sd_bus.check_call('write data to {}'.format(path), r)
+        r = sd_bus_message_close_container(msg)
+        _sd_bus.check_call('write data to {}', r, path)
 
-    r = sd_bus_call(bus.bus, msg, 0, &error, &ret_msg)
-    _sd_bus.check_call('write data to {}'.format(path), r)
+        r = sd_bus_call(bus.bus, msg, timeout, &error, &ret_msg)
+        _sd_bus.check_call('write data to {}', r, path)
+    finally:
+        sd_bus_error_free(&error)
+        sd_bus_message_unref(msg)
+        sd_bus_message_unref(ret_msg)
 
 cdef int task_cb_property_monitor(
         sd_bus_message *msg,
@@ -348,7 +357,7 @@ async def bt_property(Bus bus, str path, str iface, str name, str type):
             &msg,
             type.encode()
         )
-        _sd_bus.check_call('getting property {}'.format(name), r)
+        _sd_bus.check_call('getting property {}', r, name)
 
         bus_msg.c_obj = msg
         value =_sd_bus.msg_read_value(bus_msg, type)
@@ -425,11 +434,18 @@ def bt_notify_stop(Bus bus, str path):
 def bt_process(Bus bus):
     """
     Process D-Bus events.
+
+    The message queue is drained completely - the event loop watches the
+    sd-bus descriptor level-triggered, so a single wakeup handles the
+    whole batch of queued messages.
+
+    The function never blocks in sd_bus_wait - the event loop waits for
+    descriptor readiness and sd_bus_process reads ahead all available
+    data into the message queue before replies are dispatched.
     """
-    cdef int r
+    cdef int r = 1
     assert bus is not None
 
-    r = sd_bus_process(bus.bus, NULL)
     while r > 0:
         r = sd_bus_process(bus.bus, NULL)
 
@@ -474,6 +490,75 @@ def bt_characteristic(Bus bus, str prefix, str uuid):
 
     return path
 
+# TODO: make async
+def bt_characteristic_list(Bus bus, str prefix):
+    """
+    Fetch all GATT Characteristic paths relative to `prefix`.
+
+    Return dictionary mapping UUID of a characteristic to its path. The
+    object manager is queried once, so the function is preferred over
+    `bt_characteristic` when paths for multiple characteristics of
+    a device are needed.
+    """
+    assert bus is not None
+    assert prefix is not None
+
+    cdef sd_bus_message *msg = NULL
+    cdef sd_bus_error error = SD_BUS_ERROR_NULL
+    cdef BusMessage bus_msg = BusMessage.__new__(BusMessage)
+
+    try:
+        r = sd_bus_call_method(
+            bus.bus,
+            'org.bluez',
+            '/',
+            'org.freedesktop.DBus.ObjectManager',
+            'GetManagedObjects',
+            &error,
+            &msg,
+            NULL
+        )
+        if r < 0:
+            raise ConfigurationError(
+                'Failed to get GATT characteristics paths: {}'
+                .format(strerror(-r))
+            )
+
+        bus_msg.c_obj = msg
+
+        paths = _find_characteristic_paths(bus_msg, prefix)
+
+    finally:
+        sd_bus_message_unref(msg)
+        sd_bus_error_free(&error)
+
+    return paths
+
+def _find_characteristic_paths(BusMessage bus_msg, str prefix):
+    paths = {}
+    for _ in _sd_bus.msg_container_dict(bus_msg, '{oa{sa{sv}}}'):
+        chr_path = _sd_bus.msg_read_value(bus_msg, 'o')
+
+        if not chr_path.startswith(prefix):
+             _sd_bus.msg_skip(bus_msg, 'a{sa{sv}}')
+             continue
+
+        for _ in _sd_bus.msg_container_dict(bus_msg, '{sa{sv}}'):
+            iface = _sd_bus.msg_read_value(bus_msg, 's')
+
+            if iface != 'org.bluez.GattCharacteristic1':
+                _sd_bus.msg_skip(bus_msg, 'a{sv}')
+                continue
+
+            for _ in _sd_bus.msg_container_dict(bus_msg, '{sv}'):
+                name = _sd_bus.msg_read_value(bus_msg, 's')
+                if name == 'UUID':
+                    uuid = _sd_bus.msg_read_value(bus_msg, 'v')
+                    paths[uuid] = chr_path
+                else:
+                    _sd_bus.msg_skip(bus_msg, 'v')
+    return paths
+
 def _find_characteristic_path(BusMessage bus_msg, str prefix, str uuid):
     for _ in _sd_bus.msg_container_dict(bus_msg, '{oa{sa{sv}}}'):
         chr_path = _sd_bus.msg_read_value(bus_msg, 'o')
@@ -110,7 +110,7 @@ async def cm_init(Bus bus, str path, set services):
     handle = ConnectionManagerHandle()
     create_vtable(cm_release, cm_property, &handle.vtable)
 
-    task = asyncio.get_event_loop().create_future()
+    task = asyncio.get_running_loop().create_future()
 
     r = sd_bus_add_object_manager(bus.bus, NULL, '/')
     _sd_bus.check_call('add object manager', r)
@@ -215,7 +215,7 @@ async def bt_connect(
     cdef unsigned char *addr_data = buff_addr
     cdef unsigned char *addr_type_data = buff_addr_type
 
-    task = asyncio.get_event_loop().create_future()
+    task = asyncio.get_running_loop().create_future()
 
     r = sd_bus_message_new_method_call(
         bus.bus,
@@ -227,19 +227,19 @@ async def bt_connect(
     )
 
     try:
-        _sd_bus.check_call('bt connect call prepare {}'.format(path), r)
+        _sd_bus.check_call('bt connect call prepare {}', r, path)
 
         r = sd_bus_message_append(
             msg, 'a{sv}', 2,
             'Address', 's', addr_data,
             "AddressType", "s", addr_type_data,
         )
-        _sd_bus.check_call('bt connect call args {}'.format(path), r)
+        _sd_bus.check_call('bt connect call args {}', r, path)
 
         r = sd_bus_call_async(
             bus.bus, &slot, msg, task_cb, <void*>task, timeout
         )
-        _sd_bus.check_call('bt connect call {}'.format(path), r)
+        _sd_bus.check_call('bt connect call {}', r, path)
     finally:
         sd_bus_message_unref(msg)
 
@@ -357,7 +357,7 @@ async def _bt_agent_register_agent(Bus bus, uint64_t timeout):
     cdef sd_bus_message *msg = NULL
 
     try:
-        task = asyncio.get_event_loop().create_future()
+        task = asyncio.get_running_loop().create_future()
         r = sd_bus_message_new_method_call(
             bus.bus,
             &msg,
@@ -392,7 +392,7 @@ async def _bt_agent_request_default_agent(Bus bus, uint64_t timeout):
     cdef unsigned char *arg_data
 
     try:
-        task = asyncio.get_event_loop().create_future()
+        task = asyncio.get_running_loop().create_future()
         r = sd_bus_message_new_method_call(
             bus.bus,
             &msg,
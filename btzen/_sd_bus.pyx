@@ -57,15 +57,21 @@ def default_bus():
 
     return bus
 
-def check_call(msg_err, code):
+def check_call(msg_err, code, *args):
     """
     Raise call error if a D-Bus call has failed.
+
+    The error message is formatted with `args` only when an error is
+    raised, so callers do not pay for string formatting on the success
+    path.
     """
     error_code = -code
     if error_code in CONNECTION_ERROR:
         fmt = CONNECTION_ERROR[error_code]
         raise ConnectionError(fmt(error_code))
     elif error_code > 0:
+        if args:
+            msg_err = msg_err.format(*args)
         msg_err = 'Call failed - {}: {} ({})'.format(
             msg_err, strerror(error_code), error_code
         )
@@ -153,9 +159,12 @@ def msg_container_loop(BusMessage bus_msg, str type, str contents):
     """
     cdef char msg_type = ord(type)
     cdef sd_bus_message *msg = bus_msg.c_obj
+    # encode container signature once; the loop runs once per container
+    # item, i.e. per GATT characteristic or notified property
+    cdef bytes msg_contents = contents.encode()
 
     while True:
-        r = sd_bus_message_enter_container(msg, msg_type, contents.encode())
+        r = sd_bus_message_enter_container(msg, msg_type, msg_contents)
         check_msg_error(r)
         if r == 0:
             break
@@ -211,13 +220,13 @@ def msg_read_value(BusMessage bus_msg, str type):
         check_msg_error(r)
 
         r_value = PyBytes_FromStringAndSize(<char*>buff, buff_size)
-        logger.debug('array value of size: {}'.format(buff_size))
+        logger.debug('array value of size: %s', buff_size)
 
     elif msg_type == b's' or msg_type == b'o':
         r = sd_bus_message_read(msg, msg_type, &buff_str)
         check_msg_error(r)
         r_value = <str>buff_str
-        logger.debug('string value: {} of size {}'.format(r_value, len(r_value)))
+        logger.debug('string value: %s of size %s', r_value, len(r_value))
 
     elif msg_type == b'v':
         r = sd_bus_message_peek_type(msg, &msg_type_v, &contents)
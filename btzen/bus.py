@@ -23,7 +23,7 @@ import asyncio
 import contextvars
 import logging
 import typing as tp
-from functools import partial
+from functools import cache, partial
 
 from . import _btzen  # type: ignore
 from . import _sd_bus  # type: ignore
@@ -35,22 +35,39 @@ logger = logging.getLogger(__name__)
 INTERFACE_DEVICE = 'org.bluez.Device1'
 INTERFACE_GATT_CHR = 'org.bluez.GattCharacteristic1'
 
+# translation table to rewrite MAC address into its D-Bus path component
+_MAC_TRANS = str.maketrans('abcdef:', 'ABCDEF_')
+
+@cache
 def _mac_to_path(mac: str) -> str:
-    return mac.replace(':', '_').upper()
+    return mac.translate(_MAC_TRANS)
 
 class Bus:
+    """
+    D-Bus connection for Bluetooth device communication.
+
+    All D-Bus events are pumped from a single place - the reader
+    callback installed on the event loop - and processed in batches on
+    the event loop thread. The sd-bus connection is not thread safe, so
+    keep it that way.
+    """
     BUS = contextvars.ContextVar[tp.Optional['Bus']]('BUS', default=None)
 
     def __init__(self, system_bus: _sd_bus.Bus, interface: str) -> None:
         self.system_bus = system_bus
         self.interface = interface
 
-        loop = asyncio.get_event_loop()
+        # the sd-bus file descriptor is the only integration point with
+        # the event loop; an application can install an alternative event
+        # loop implementation, i.e. io_uring based one, without changes in
+        # btzen
+        loop = asyncio.get_running_loop()
         process = partial(_btzen.bt_process, system_bus)
         loop.add_reader(system_bus.fileno, process)
 
         self._notifications = Notifications(self)
         self._characteristic_cache: dict[tuple[str, str], str] = {}
+        self._dev_path_cache: dict[str, str] = {}
 
     @staticmethod
     def create_bus(interface: str) -> Bus:
@@ -92,42 +109,45 @@ class Bus:
         :param uuid: UUID of Bluetooth GATT Characteristic.
         """
         key = mac, uuid
-        prefix = self.dev_path(mac)
         path = self._characteristic_cache.get(key)
         if path is None:
+            prefix = self.dev_path(mac)
             path = _btzen.bt_characteristic(self.system_bus, prefix, uuid)
 
-        # store in cache only non-null values
-        if path is None:
-            raise BTZenError('Path for {}/{} not found'.format(mac, uuid))
-        else:
-            self._characteristic_cache[key] = path
+            # store in cache only non-null values
+            if path is None:
+                raise BTZenError('Path for {}/{} not found'.format(mac, uuid))
+            else:
+                self._characteristic_cache[key] = path
         return path
 
     async def ensure_characteristic_paths(self, mac: str, *uuid: str) -> None:
         """
         Ensure Bluetooth GATT characteristic path exists for each UUID.
-        """
-        # TODO: in the future we might want to use object manager
-        for u in uuid:
-            await self.ensure_characteristic_path(mac, u)
 
-    async def ensure_characteristic_path(self, mac: str, uuid: str) -> None:
-        key = mac, uuid
+        All characteristic paths of the Bluetooth device are fetched with
+        a single object manager call and stored in the cache.
+        """
         prefix = self.dev_path(mac)
+        missing = set(uuid)
         for i in range(DEFAULT_CHARACTERISTIC_PATH_RETRY):
-            path = _btzen.bt_characteristic(self.system_bus, prefix, uuid)
-            if path is None:
-                logger.warning(
-                    'characteristic path not found for {}/{}'.format(mac, uuid)
-                )
-                await asyncio.sleep(1)
-            else:
-                self._characteristic_cache[key] = path
+            paths = _btzen.bt_characteristic_list(self.system_bus, prefix)
+            self._characteristic_cache.update(
+                ((mac, u), p) for u, p in paths.items()
+            )
+            missing.difference_update(paths)
+            if not missing:
                 return
 
+            logger.warning(
+                'characteristic paths not found for {}/{}'
+                .format(mac, ', '.join(sorted(missing)))
+            )
+            await asyncio.sleep(1)
+
         raise BTZenError(
-            'Cannot determine characteristic path for {}/{}'.format(mac, uuid)
+            'Cannot determine characteristic path for {}/{}'
+            .format(mac, ', '.join(sorted(missing)))
         )
 
     def _gatt_start(self, path: str) -> None:
@@ -145,11 +165,16 @@ class Bus:
         return '/org/bluez/{}'.format(self.interface)
 
     def dev_path(self, mac: str) -> str:
-        return '/org/bluez/{}/dev_{}'.format(self.interface, _mac_to_path(mac))
+        path = self._dev_path_cache.get(mac)
+        if path is None:
+            path = '/org/bluez/{}/dev_{}'.format(
+                self.interface, _mac_to_path(mac)
+            )
+            self._dev_path_cache[mac] = path
+        return path
 
-    async def _gatt_get(self, path: str) -> tp.Any:
-        task = self._notifications.get(path, INTERFACE_GATT_CHR, 'Value')
-        return (await task)
+    def _gatt_get(self, path: str) -> tp.Coroutine[None, None, tp.Any]:
+        return self._notifications.get(path, INTERFACE_GATT_CHR, 'Value')
 
     def _gatt_stop(self, path: str) -> None:
         try:
@@ -168,15 +193,14 @@ class Bus:
         path = self.dev_path(mac)
         self._notifications.start(path, iface, name)
 
-    async def _dev_property_get(
+    def _dev_property_get(
             self,
             mac: str,
             name: str,
             iface: str=INTERFACE_DEVICE,
-    ) -> tp.Any:
+    ) -> tp.Coroutine[None, None, tp.Any]:
         path = self.dev_path(mac)
-        value = await self._notifications.get(path, iface, name)
-        return value
+        return self._notifications.get(path, iface, name)
 
     def _dev_property_stop(
         self, mac: str, name: str, iface: str=INTERFACE_DEVICE
@@ -218,10 +242,12 @@ class Notifications:
         key = path, iface
         return self._data[key].size(name)  # type: ignore
 
-    async def get(self, path: str, iface: str, name: str) -> tp.Any:
+    def get(
+        self, path: str, iface: str, name: str
+    ) -> tp.Coroutine[None, None, tp.Any]:
         key = path, iface
         data = self._data[key]
-        return (await data.get(name))
+        return data.get(name)  # type: ignore
 
     def stop(self, path: str, iface: str) -> None:
         # TODO: add name and call PropertyNotification.stop when no
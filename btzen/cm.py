@@ -67,7 +67,7 @@ from .error import BTZenError
 from .config import DEFAULT_DBUS_TIMEOUT, DEFAULT_CONNECTION_TIMEOUT
 from .data import T, AddressType
 from .device import DeviceBase
-from .devio import enable, disable, disarm
+from .devio import enable, disable, disarm, read
 from .session import BT_SESSION, Session, get_session, is_active
 from .service import S
 from .util import concat
@@ -97,6 +97,9 @@ async def connect(
     by_mac = defaultdict(set)
     for dev in devices:
         by_mac[dev.mac].add(dev)
+        # resolve single-dispatch implementation at session setup, so the
+        # first read of a device does not pay for the MRO based resolution
+        read.dispatch(type(dev))
 
     # TODO: if bluez daemon is restarted, the connection manager needs
     # to be reinitialized
@@ -219,8 +222,16 @@ async def create_connection(
 async def enable_devices(mac: str, devices: Devices) -> None:  # type: ignore
     logger.info('enabling devices: {}'.format(mac))
 
-    for dev in devices:
-        await enable(dev)
+    # enable devices concurrently, so their d-bus calls are submitted up
+    # front and the round trips to bluez daemon overlap; wait for all of
+    # them before raising an error, so no enable coroutine is left
+    # running when devices are disabled afterwards
+    results = await asyncio.gather(
+        *(enable(dev) for dev in devices), return_exceptions=True
+    )
+    errors = [r for r in results if isinstance(r, BaseException)]
+    if errors:
+        raise errors[0]
 
     get_session().set_connected(mac)
     logger.info('enabled services: {}'.format(mac))
@@ -29,6 +29,7 @@ Basic operations
 - `enable`
 - `disable`
 - `read`
+- `read_batch`
 - `write`
 """
 
@@ -51,6 +52,12 @@ from .session import get_session, connected, is_active
 
 logger = logging.getLogger(__name__)
 
+# bind extension calls once at import time; the attribute lookups are on
+# the per-read and per-write paths
+_bt_read = _btzen.bt_read
+_bt_write = _btzen.bt_write
+_bt_write_sync = _btzen.bt_write_sync
+
 @singledispatch
 async def read(device: DeviceBase[Service, T], *args: tp.Any) -> T:
     """
@@ -75,14 +82,31 @@ async def read_all(device: DeviceBase[Service, T]) -> AsyncIterator[T]:
 
     :param device: Bluetooth device to read data from.
     """
+    # resolve single-dispatch implementation once; the device type does
+    # not change while reading
+    f_read = read.dispatch(type(device))
     while is_active():
         try:
-            value = await read(device)
+            value = await f_read(device)
         except ConnectionError as ex:
             logger.info('{}: {}'.format(device, ex))
         else:
             yield value
 
+async def read_batch(*devices: DeviceBase[Service, T]) -> list[T]:
+    """
+    Read data from multiple Bluetooth devices.
+
+    Read requests for all devices are submitted first, and then the
+    replies are awaited, so the D-Bus round trips overlap instead of
+    adding up.
+
+    Like with `read`, the coroutine can raise connection error.
+
+    :param devices: Bluetooth devices to read data from.
+    """
+    return await asyncio.gather(*(read(dev) for dev in devices))
+
 @singledispatch
 async def write(device: DeviceBase[Service, T], data: bytes) -> None:
     """
@@ -95,6 +119,11 @@ async def write(device: DeviceBase[Service, T], data: bytes) -> None:
         'Write function for {} is not implemented'.format(device)
     )
 
+# NOTE: single-dispatch functions cache the resolved implementation per
+# device proxy class, so after the first call dispatch is a dictionary
+# lookup; a manual type to function mapping would not be faster and would
+# lose the subclass resolution the device and service product types rely
+# on
 @singledispatch
 async def enable(device: DeviceBase[Service, T]) -> None:
     """
@@ -126,7 +155,7 @@ async def _read_dev(device: Device[ServiceCharacteristic, T]) -> T:
 
         task = session.create_task(
             device,
-            _btzen.bt_read(bus.system_bus, path, DEFAULT_DBUS_TIMEOUT)
+            _bt_read(bus.system_bus, path, DEFAULT_DBUS_TIMEOUT)
         )
         data = await task
         return device.convert(data)
@@ -199,10 +228,22 @@ async def _disable_device_trigger(device: DeviceTrigger[ServiceCharacteristic, T
 async def write_config(mac: str, uuid: str, data: bytes) -> None:
     bus = get_session().bus
     path = bus.characteristic_path(mac, uuid)
-    await _btzen.bt_write(
+    await _bt_write(
         bus.system_bus, path, data, DEFAULT_DBUS_TIMEOUT
     )
 
+def write_config_sync(mac: str, uuid: str, data: bytes) -> None:
+    """
+    Write device configuration data synchronously.
+
+    To be used for tiny configuration payloads only, i.e. single byte of
+    a sensor time interval, where the asynchronous call task setup
+    outweighs the write itself.
+    """
+    bus = get_session().bus
+    path = bus.characteristic_path(mac, uuid)
+    _bt_write_sync(bus.system_bus, path, data, DEFAULT_DBUS_TIMEOUT)
+
 async def disarm(
         msg: str, warn: str, f: tp.Callable[..., tp.Any], *args: tp.Any
     ) -> None:
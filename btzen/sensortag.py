@@ -46,8 +46,8 @@ from functools import partial
 
 from .data import T, Button, Make, ServiceType, Trigger, TriggerCondition
 from .device import Device, DeviceTrigger
-from .devio import enable, disable, write_config, disarm, \
-    _enable_dev_trigger
+from .devio import enable, disable, write_config, write_config_sync, \
+    disarm, _enable_dev_trigger
 from .service import ServiceCharacteristic, register_service
 from .session import get_session
 from .util import to_int, to_uuid as to_bt_uuid
@@ -57,8 +57,12 @@ logger = logging.getLogger(__name__)
 HDC1000_HUMIDITY = 65536 / 100
 ACCEL = 0x08 | 0x10 | 0x20
 ACCEL_WAKE_ON_MOTION = 0x80
+# accelerometer configuration payloads, precomputed at import time
+ACCEL_CONFIG_ON = struct.pack('<H', ACCEL | ACCEL_WAKE_ON_MOTION)
+ACCEL_CONFIG_OFF = b'\x00\x00'
 MPU9250_GYRO = 65536 / 500
 MPU9250_ACCEL_2G = 32768 / 2
+MPU9250_ACCEL_SCALE = 1 / MPU9250_ACCEL_2G
 MPU9250_ACCEL_UNPACK = struct.Struct('<3h').unpack
 
 @dtc.dataclass(frozen=True)
@@ -111,8 +115,8 @@ def convert_accel(data: bytes) -> tuple[float, float, float]:
     """
     # gyro: data[:6]
     # magnet: data[12:]
-    x, y, z = tp.cast(tuple[float, float, float], MPU9250_ACCEL_UNPACK(data[6:12]))
-    return (x / MPU9250_ACCEL_2G, y / MPU9250_ACCEL_2G, z / MPU9250_ACCEL_2G)
+    x, y, z = MPU9250_ACCEL_UNPACK(data[6:12])
+    return (x * MPU9250_ACCEL_SCALE, y * MPU9250_ACCEL_SCALE, z * MPU9250_ACCEL_SCALE)
 
 def convert_button(data: bytes) -> SensorTagButtonState:
     """
@@ -185,8 +189,8 @@ register_st(
         18,
         to_uuid(0xaa82),
         to_uuid(0xaa83),
-        struct.pack('<H', ACCEL | ACCEL_WAKE_ON_MOTION),
-        b'\x00\x00',
+        ACCEL_CONFIG_ON,
+        ACCEL_CONFIG_OFF,
     ),
     convert=convert_accel,
     trigger=Trigger(TriggerCondition.FIXED_TIME, 0.1),
@@ -216,7 +220,7 @@ async def _enable_sensor_tag(device: Device[SensorTagService, T]) -> None:
     value = int(device.service.interval * 100)
     assert value < 256  # TODO: raise value error
 
-    await write_config(device.mac, device.service.uuid_trigger, bytes([value]))
+    write_config_sync(device.mac, device.service.uuid_trigger, bytes([value]))
     logger.info('interval for {} is set'.format(device))
 
 @disable.register  # type: ignore
@@ -239,7 +243,7 @@ async def _enable_sensor_tag_tr(
     value = int(device.trigger.operand * 100)
     assert value < 256  # TODO: raise value error
 
-    await write_config(device.mac, device.service.uuid_trigger, bytes([value]))
+    write_config_sync(device.mac, device.service.uuid_trigger, bytes([value]))
     logger.info('trigger for {} is set'.format(device))
 
     await _enable_dev_trigger(device)
@@ -27,6 +27,7 @@ Tested with HeinrichsWeikamp OSTC 2 dive computer.
 """
 
 import asyncio
+import dataclasses as dtc
 import math
 import logging
 import typing as tp
@@ -46,6 +47,9 @@ from .util import to_uuid
 
 logger = logging.getLogger(__name__)
 
+# bound once at import time, used on the per-write path
+_bt_write = _btzen.bt_write
+
 T = tp.TypeVar('T', bound=bytes)
 
 UUID_RX_UART = '00000001-0000-1000-8000-008025000000'
@@ -53,12 +57,13 @@ UUID_TX_UART = '00000002-0000-1000-8000-008025000000'
 UUID_TX_CREDIT = '00000004-0000-1000-8000-008025000000'
 UUID_RX_CREDIT = '00000003-0000-1000-8000-008025000000'
 
-class State(tp.TypedDict):
+@dtc.dataclass(slots=True)
+class State:
     """
     Device state with buffer and number of RX credits.
     """
-    buffer: bytearray
-    rx_credits: int
+    buffer: bytearray = dtc.field(default_factory=bytearray)
+    rx_credits: int = 0
 
 class SerialService(Service):
     pass
@@ -74,7 +79,7 @@ def device_state(device: Device[SerialService, T]) -> State:
     """
     Create or get serial device state.
     """
-    return State(buffer=bytearray(), rx_credits=0)
+    return State()
 
 @read.register  # type: ignore
 async def _read_serial(device: Device[SerialService, T], n: int) -> bytes:
@@ -84,7 +89,7 @@ async def _read_serial(device: Device[SerialService, T], n: int) -> bytes:
 
 async def _read_data(bus: Bus, device: Device[SerialService, T], n: int) -> bytes:
     state = device_state(device)
-    data = bytearray(state['buffer'])
+    data = bytearray(state.buffer)
 
     await bus.ensure_characteristic_paths(
         device.mac, UUID_TX_UART, UUID_RX_UART, UUID_TX_CREDIT, UUID_RX_CREDIT
@@ -97,16 +102,17 @@ async def _read_data(bus: Bus, device: Device[SerialService, T], n: int) -> byte
             item = await bus._gatt_get(path_uart)
             data.extend(item)
 
-            if __debug__:
+            if __debug__ and logger.isEnabledFor(logging.DEBUG):
                 logger.debug(
-                    'bytes expected {}, bytes read {}, last {}, tx credits size {}'
-                    .format(n, len(data), hexlify(data[-5:]).decode(), _tx_credit_size(bus, device.mac))
+                    'bytes expected %s, bytes read %s, last %s, tx credits size %s',
+                    n, len(data), hexlify(data[-5:]).decode(),
+                    _tx_credit_size(bus, device.mac)
                 )
 
     assert len(data) >= n
 
     # keep extra data in buffer, return only requested number of bytes
-    state['buffer'] = data[n:]
+    state.buffer = data[n:]
     return data[:n]
 
 @write.register  # type: ignore
@@ -115,7 +121,7 @@ async def _write_serial(device: Device[SerialService, T], data: bytes) -> None:
     async with connected(device) as session:
         state = device_state(device)
 
-        if state['rx_credits'] < 1:
+        if state.rx_credits < 1:
             await _add_rx_credits(session.bus, device)
 
         if _tx_credit_size(session.bus, device.mac) > 0:
@@ -131,8 +137,8 @@ async def _enable_serial(device: Device[SerialService, T]) -> None:
 
     # reset cache for device
     state = device_state(device)
-    state['buffer'] = bytearray()
-    state['rx_credits'] = 0
+    state.buffer = bytearray()
+    state.rx_credits = 0
 
     bus._gatt_start(get_path(UUID_TX_CREDIT))
     bus._gatt_start(get_path(UUID_TX_UART))
@@ -162,7 +168,7 @@ async def _disable_serial(device: Device[SerialService, T]) -> None:
 async def _tx_credit(bus: Bus, mac: str) -> None:
     path = bus.characteristic_path(mac, UUID_TX_CREDIT)
     n = await bus._gatt_get(path)
-    logger.debug('got tx credits: {}'.format(n))
+    logger.debug('got tx credits: %s', n)
 
 def _tx_credit_size(bus: Bus, mac: str) -> int:
     path = bus.characteristic_path(mac, UUID_TX_CREDIT)
@@ -174,8 +180,8 @@ async def _add_rx_credits(
 
     state = device_state(device)
     await _write(bus, device.mac, UUID_RX_CREDIT, bytes([n]))
-    state['rx_credits'] += n
-    logger.debug('rx credits: {}'.format(state['rx_credits']))
+    state.rx_credits += n
+    logger.debug('rx credits: %s', state.rx_credits)
 
 @asynccontextmanager
 async def _rx_credits_mgr(
@@ -183,17 +189,17 @@ async def _rx_credits_mgr(
     ) -> tp.AsyncIterator[None]:
 
     state = device_state(device)
-    if state['rx_credits'] < 1:
+    if state.rx_credits < 1:
         await _add_rx_credits(bus, device, credits_for(n))
 
     try:
         yield
     finally:
-        state['rx_credits'] -= 1
+        state.rx_credits -= 1
 
 async def _write(bus: Bus, mac: str, uuid: str, data: bytes) -> None:
     path = bus.characteristic_path(mac, uuid)
-    task = _btzen.bt_write(bus.system_bus, path, data, DEFAULT_DBUS_TIMEOUT)
+    task = _bt_write(bus.system_bus, path, data, DEFAULT_DBUS_TIMEOUT)
     await task
 
 def credits_for(n: int) -> int:
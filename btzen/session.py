@@ -102,9 +102,11 @@ class Session:
                 'Device with address {} not managed by BTZen connection manager'
                 .format(device.mac)
             )
-        # create task, which can be cancelled with connection error
-        task = self.create_task(device, event.wait())
-        await task
+        # fast path - no task setup when device is connected already
+        if not event.is_set():
+            # create task, which can be cancelled with connection error
+            task = self.create_task(device, event.wait())
+            await task
 
     def is_active(self) -> bool:
         return self._is_active